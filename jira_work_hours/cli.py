@@ -5,17 +5,32 @@ installed and invoked via the console script `get-work-hours`.
 """
 from __future__ import annotations
 
+import collections
+import functools
+import operator
 import os
+import re
 import sys
+import time
 import datetime
-import dateparser
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
 from jira import JIRA
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .login_helper import ensure_credentials
 
 # ----------------------- Configuration & Helpers ----------------------- #
 
+def _dateparser():
+    # Importing dateparser compiles thousands of locale regexes (tens of MB
+    # and a noticeable startup pause), so it is deferred until a date string
+    # actually needs natural-language parsing; ISO input never pays for it.
+    import dateparser
+    return dateparser
+
 def _str2bool(val, default=False):
     if val is None:
         return default
@@ -37,6 +52,10 @@ def _load_activity_types():
 
 
 def _load_holidays():
+    # HOLIDAYS is documented as a comma list of YYYY-MM-DD dates; a
+    # dateparser fallback here would drag its locale tables into every
+    # module import just to tolerate a malformed .env entry. Warn and skip
+    # instead.
     raw = os.getenv("HOLIDAYS", "")
     days = set()
     for tok in raw.split(","):
@@ -45,10 +64,8 @@ def _load_holidays():
             continue
         try:
             days.add(datetime.date.fromisoformat(s))
-        except Exception:
-            d = dateparser.parse(s)
-            if d:
-                days.add(d.date())
+        except ValueError:
+            print(f"Warning: ignoring HOLIDAYS entry (not YYYY-MM-DD): {s}")
     return days
 
 
@@ -60,31 +77,104 @@ JIRA_PAT = os.getenv("JIRA_PAT")
 
 ACTIVITY_TYPE_FIELD = os.getenv("ACTIVITY_TYPE_FIELD", "customfield_22016")
 PRODUCTIVE_ACTIVITY_TYPES = _load_activity_types()
+# List keeps env-file ordering for display; frozenset serves the per-issue
+# membership test.
+PRODUCTIVE_ACTIVITY_TYPES_SET = frozenset(PRODUCTIVE_ACTIVITY_TYPES)
 WORKING_HOURS_PER_DAY = float(os.getenv("WORKING_HOURS_PER_DAY", "8"))
 EXCLUDE_WEEKENDS_DEFAULT = _str2bool(os.getenv("EXCLUDE_WEEKENDS", "true"))
-PAGE_SIZE = int(os.getenv("PAGE_SIZE", "100"))
-HOLIDAYS = _load_holidays()
-DONE_STATUSES = {s.strip().lower() for s in os.getenv("DONE_STATUSES", "Done,Closed,Resolved,Completed").split(",") if s.strip()}
+PAGE_SIZE = int(os.getenv("PAGE_SIZE", "500"))
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "8"))
+# Escape hatch for flaky VPNs where concurrent requests trip connection
+# resets; serial fetching is slower but sturdier.
+PARALLEL_FETCH = _str2bool(os.getenv("PARALLEL_FETCH", "true"), default=True)
+# (connect, read) timeout in seconds; without it a bad hostname or dead
+# proxy hangs the login probe for the OS default (~60s+).
+JIRA_TIMEOUT = (float(os.getenv("JIRA_CONNECT_TIMEOUT", "5")), float(os.getenv("JIRA_READ_TIMEOUT", "30")))
+HOLIDAYS = frozenset(_load_holidays())
+DONE_STATUSES = frozenset(s.strip().lower() for s in os.getenv("DONE_STATUSES", "Done,Closed,Resolved,Completed").split(",") if s.strip())
+# The exclusion messages repeat this join per skipped issue; format once.
+_DONE_STATUSES_STR = ", ".join(sorted(DONE_STATUSES))
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+# Field projection for productivity searches: everything _compute_productivity
+# reads, so no follow-up per-issue GET is needed.
+PRODUCTIVITY_FIELDS = f"summary,issuetype,status,timeoriginalestimate,subtasks,worklog,{ACTIVITY_TYPE_FIELD}"
+
+# Constant JQL templates: every report sends the same query text modulo the
+# bound dates, so the server's query cache sees one shape per report type.
+JQL_WORKLOG_RANGE = 'worklogDate >= "{start}" AND worklogDate < "{end}" AND worklogAuthor = currentUser()'
+JQL_CREATED_BY = "created >= '{start}' AND created < '{end}' AND reporter = '{reporter}'"
+
+
+def _jql_date(d):
+    # f-string int formatting skips strftime's format-code walk.
+    return f"{d.year:04d}/{d.month:02d}/{d.day:02d}"
+
+
+def _worklog_jql(start_date, end_date_exclusive):
+    """Worklog-range JQL for [start_date, end_date_exclusive)."""
+    return JQL_WORKLOG_RANGE.format(start=_jql_date(start_date),
+                                    end=_jql_date(end_date_exclusive))
+
+
+def _issue_url(issue_key):
+    """Browse link built locally from JIRA_URL.
+
+    issue.permalink() triggers an extra request in some jira-python
+    versions; the URL is derivable from the configured server.
+    """
+    return f"{(JIRA_URL or '').rstrip('/')}/browse/{issue_key}"
 
 
 def _format_percent(value):
     return f"{value:.2f}%" if value is not None else "N/A"
 
 
+# Productivity target band plus the classification messages, shared by the
+# per-issue and final-aggregate report sections (previously four duplicated
+# if/elif chains).
+TARGET_MIN = 30.0
+TARGET_MAX = 45.0
+_CLASSIFY_DETAIL = (
+    "✅ Good productivity (within 30–45% target range). Great work.",
+    "ℹ️ Productivity above target range (>45%). Recheck if estimate was too high or if time is under‑logged.",
+    "⚠️ Below target range (<30%). Add remaining work logs or validate the original estimate.",
+    "❌ Over estimate (logged more time than estimated). Review estimate or scope changes.",
+)
+_CLASSIFY_FINAL = (
+    "✅ Good productivity (within 30–45% target range). Great work.",
+    "ℹ️ Above target range (>45%). Recheck estimates or under‑logging.",
+    "⚠️ Below target range (<30%). Review estimates or missing work logs.",
+    "❌ Over estimate (more time logged than estimated).",
+)
+
+
+def _classify_score(ps, messages=_CLASSIFY_DETAIL):
+    if TARGET_MIN <= ps <= TARGET_MAX:
+        return messages[0]
+    if ps > TARGET_MAX:
+        return messages[1]
+    if ps >= 0:
+        return messages[2]
+    return messages[3]
+
+
 def _print_table(headers, rows):
-    widths = [len(str(h)) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            widths[i] = max(widths[i], len(str(cell)))
+    header_row = [str(h) for h in headers]
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    # Column-wise max over the transposed table instead of per-cell index
+    # assignment.
+    widths = [max(map(len, col)) for col in zip(header_row, *str_rows)]
 
     def fmt_row(row):
-        return "| " + " | ".join(str(cell).ljust(widths[i]) for i, cell in enumerate(row)) + " |"
+        return "| " + " | ".join(cell.ljust(widths[i]) for i, cell in enumerate(row)) + " |"
 
     sep = "+-" + "-+-".join("-" * w for w in widths) + "-+"
-    print(sep); print(fmt_row(headers)); print(sep)
-    for r in rows:
-        print(fmt_row(r))
-    print(sep)
+    lines = [sep, fmt_row(header_row), sep]
+    lines.extend(fmt_row(r) for r in str_rows)
+    lines.append(sep)
+    print("\n".join(lines))
 
 
 def connect_to_jira():
@@ -96,10 +186,24 @@ def connect_to_jira():
         print("Error: JIRA_URL, JIRA_USERNAME, and JIRA_PAT must be set.")
         return None, None
     try:
-        jira = JIRA(server=JIRA_URL, token_auth=JIRA_PAT)
+        jira = JIRA(server=JIRA_URL, token_auth=JIRA_PAT, timeout=JIRA_TIMEOUT)
+        # Size the urllib3 pool to the worklog fan-out: with the default
+        # settings the concurrent fetches overflow the pool and each
+        # discarded connection costs a fresh TCP+TLS handshake.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(10, MAX_WORKERS * 2),
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 502, 503, 504]),
+        )
+        jira._session.mount("https://", adapter)
+        jira._session.mount("http://", adapter)
+        _productivity_cache.clear()  # results may belong to other credentials
+        # Probe with myself() instead of the old server_info() version
+        # banner: it still fails fast on bad credentials, and caching its
+        # payload lets the first report skip its own identity round-trip.
+        jira._me_cached = _identity_from_myself(jira.myself())
         print("Connected to Jira.")
-        info = jira.server_info()
-        print(f"Jira Version: {info.get('version')}")
         return jira, JIRA_USERNAME
     except Exception as e:  # pragma: no cover - network call
         print(f"Error connecting to Jira: {e}")
@@ -107,44 +211,194 @@ def connect_to_jira():
 
 
 def _search_all_issues(jira, jql, fields="summary,issuetype,status,timeoriginalestimate,subtasks", expand=None, batch=PAGE_SIZE):
-    start_at = 0
-    issues = []
-    while True:
-        chunk = jira.search_issues(jql, startAt=start_at, maxResults=batch, fields=fields, expand=expand)
-        issues.extend(chunk)
-        if len(chunk) < batch:
-            break
-        start_at += batch
+    """All issues matching `jql`, fetching pages after the first in parallel.
+
+    The first page doubles as the probe: its `total` says how many pages
+    remain, and its length is the effective page size after any server
+    clamp (jira.search.views.default.max). Remaining pages are independent
+    offsets, so they go through the worklog thread pool; order is
+    preserved. The PARALLEL_FETCH=false branch walks the same offsets
+    serially — this is the only pagination implementation.
+    """
+    first = jira.search_issues(jql, startAt=0, maxResults=batch, fields=fields,
+                               expand=expand, validate_query=False)
+    issues = list(first)
+    total = getattr(first, "total", len(issues))
+    if not issues or len(issues) >= total:
+        return issues
+    step = len(issues)
+    offsets = range(step, total, step)
+
+    def _fetch_page(start_at):
+        return jira.search_issues(jql, startAt=start_at, maxResults=step, fields=fields,
+                                  expand=expand, validate_query=False)
+
+    if not PARALLEL_FETCH or len(offsets) == 1:
+        for start_at in offsets:
+            issues.extend(_fetch_page(start_at))
+        return issues
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(offsets))) as executor:
+        for page in executor.map(_fetch_page, offsets):
+            issues.extend(page)
     return issues
 
 
+def _fetch_worklogs_parallel(jira, issue_keys, max_workers=MAX_WORKERS):
+    """Fetch worklogs for many issues concurrently.
+
+    Each `jira.worklogs(key)` call is a blocking round-trip, so reports over
+    many issues pay latency x N when fetched sequentially. Returns a dict
+    mapping issue key -> list of worklogs; a failed fetch yields an empty
+    list rather than aborting the batch.
+    """
+    results = {}
+    keys = list(issue_keys)
+    if not keys:
+        return results
+
+    def _fetch(key):
+        try:
+            return key, jira.worklogs(key)
+        except Exception:
+            return key, []
+
+    if not PARALLEL_FETCH or len(keys) == 1:
+        for key in keys:
+            results[key] = _fetch(key)[1]
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        for key, worklogs in executor.map(_fetch, keys):
+            results[key] = worklogs
+    return results
+
+
+def _embedded_worklogs(issue):
+    """Return the worklog list embedded by expand="worklog", or None.
+
+    Jira truncates the embedded payload (total > maxResults) for issues with
+    many worklogs; in that case None is returned so callers fall back to a
+    dedicated fetch.
+    """
+    wl_field = getattr(issue.fields, "worklog", None)
+    if wl_field is None:
+        return None
+    try:
+        if wl_field.total <= wl_field.maxResults:
+            return wl_field.worklogs
+    except AttributeError:
+        pass
+    return None
+
+
+def _issue_worklogs(jira, issue):
+    """Full worklog list for a single issue, avoiding a round-trip when the
+    embedded expand="worklog" payload is complete."""
+    embedded = _embedded_worklogs(issue)
+    if embedded is not None:
+        return embedded
+    try:
+        return jira.worklogs(issue.key)
+    except Exception:
+        return []
+
+
+def _collect_worklogs(jira, issues):
+    """Map issue key -> full worklog list for a batch of search results.
+
+    Issues whose embedded worklog payload is complete cost no extra request;
+    only truncated ones are re-fetched, concurrently.
+    """
+    by_key = {}
+    to_fetch = []
+    for issue in issues:
+        embedded = _embedded_worklogs(issue)
+        if embedded is not None:
+            by_key[issue.key] = embedded
+        else:
+            to_fetch.append(issue.key)
+    by_key.update(_fetch_worklogs_parallel(jira, to_fetch))
+    return by_key
+
+
+def _identity_from_myself(me):
+    return {
+        "accountId": me.get("accountId"),
+        "name": me.get("name"),
+        "displayName": me.get("displayName"),
+        "emailAddress": me.get("emailAddress"),
+    }
+
+
 def get_me(jira):
+    # Identity is stable for the life of a connection; stash it on the
+    # client so each report does not repeat the myself() round-trip.
+    # connect_to_jira pre-seeds this cache from its login probe.
+    cached = getattr(jira, "_me_cached", None)
+    if cached is not None:
+        return cached
     try:
-        me = jira.myself()
-        return {
-            "accountId": me.get("accountId"),
-            "name": me.get("name"),
-            "displayName": me.get("displayName"),
-            "emailAddress": me.get("emailAddress"),
-        }
+        result = _identity_from_myself(jira.myself())
+        jira._me_cached = result
+        return result
     except Exception:
+        # Transient failure: fall back without caching so a later call can
+        # still resolve the full identity.
         return {"accountId": None, "name": JIRA_USERNAME, "displayName": None, "emailAddress": None}
 
 
-def _is_my_worklog(worklog, me):
-    wl_author = getattr(worklog, "author", None)
-    if not wl_author:
+def _make_author_matcher(me):
+    """Build a worklog-author predicate for one report run.
+
+    Pre-lowers the identity fields once so the per-worklog check (which can
+    run thousands of times per report) is a few attribute reads, with the
+    common accountId match tried first.
+    """
+    account_id = me.get("accountId")
+    name_lower = (me.get("name") or "").lower() or None
+    display_name = me.get("displayName")
+
+    def match(worklog):
+        author = getattr(worklog, "author", None)
+        if author is None:
+            return False
+        if account_id and getattr(author, "accountId", None) == account_id:
+            return True
+        if name_lower:
+            author_name = getattr(author, "name", None)
+            if author_name and author_name.lower() == name_lower:
+                return True
+        if display_name and getattr(author, "displayName", None) == display_name:
+            return True
         return False
-    if hasattr(wl_author, "accountId") and me.get("accountId") and wl_author.accountId == me.get("accountId"):
-        return True
-    if hasattr(wl_author, "name") and me.get("name") and wl_author.name and wl_author.name.lower() == me.get("name").lower():
-        return True
-    if hasattr(wl_author, "displayName") and me.get("displayName") and wl_author.displayName == me.get("displayName"):
-        return True
-    return False
+
+    return match
 
 
+# Matches the timestamp shape Jira actually emits
+# (YYYY-MM-DDThh:mm:ss[.sss](Z|+hhmm|+hh:mm)); group-to-int construction
+# beats fromisoformat and skips the string surgery the fallbacks need.
+_ISO_TS_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})"
+    r"(?:\.\d+)?(?:(Z)|([+-])(\d{2}):?(\d{2}))?$"
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_iso_date(dt_str):
+    # Worklog timestamps repeat heavily across reports in one session, and
+    # the dateparser fallback in particular is expensive; cache on the raw
+    # string.
+    m = _ISO_TS_RE.match(dt_str)
+    if m:
+        y, mo, d, h, mi, s, zulu, sign, tzh, tzm = m.groups()
+        tz = None
+        if zulu:
+            tz = datetime.timezone.utc
+        elif sign:
+            offset = datetime.timedelta(hours=int(tzh), minutes=int(tzm))
+            tz = datetime.timezone(-offset if sign == "-" else offset)
+        return datetime.datetime(int(y), int(mo), int(d), int(h), int(mi), int(s), tzinfo=tz)
     try:
         return datetime.datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
     except Exception:
@@ -152,23 +406,75 @@ def _parse_iso_date(dt_str):
         try:
             return datetime.datetime.strptime(base, "%Y-%m-%dT%H:%M:%S")
         except Exception:
-            parsed = dateparser.parse(dt_str)
+            parsed = _dateparser().parse(dt_str)
             if parsed:
                 return parsed
             raise ValueError(f"Unrecognized datetime: {dt_str}")
 
 
+def _worklog_date_str(worklog):
+    """YYYY-MM-DD portion of worklog.started without building a datetime.
+
+    The first 10 characters of an ISO timestamp are the date, so the hot
+    filter paths can compare strings directly; anything shaped differently
+    falls back to full parsing. Returns None when the timestamp is
+    unusable.
+    """
+    started = getattr(worklog, "started", None) or ""
+    day = started[:10]
+    if len(day) == 10 and day[4] == "-" and day[7] == "-":
+        return day
+    try:
+        return _parse_iso_date(started).date().isoformat()
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _dateparser_parse_cached(s, _today):
+    # Keyed on today's date so cached relative terms ("yesterday") stay
+    # correct in long-running sessions; pinning the language skips
+    # dateparser's per-call locale detection.
+    return _dateparser().parse(s, languages=["en"])
+
+
+def _parse_user_date(date_str):
+    """Parse a user-supplied date, trying the cheap ISO path first.
+
+    dateparser handles natural language ("yesterday", "24th Aug") but each
+    call is expensive; well-formed YYYY-MM-DD input skips it entirely and
+    repeated natural-language input hits the cache. Returns a
+    datetime.date or None.
+    """
+    s = (date_str or "").strip()
+    try:
+        return datetime.date.fromisoformat(s)
+    except ValueError:
+        pass
+    parsed = _dateparser_parse_cached(s, datetime.date.today())
+    return parsed.date() if parsed else None
+
+
 def is_done_status(name):
     return (name or "").lower() in DONE_STATUSES
 
 
 def _dates_in_range(start_date, end_date, exclude_weekends=True, holidays=HOLIDAYS):
+    # Index arithmetic instead of a day-by-day timedelta walk: weekday of
+    # day i is (start_weekday + i) % 7, so weekend days are skipped without
+    # constructing a date object for them.
+    n = (end_date - start_date).days + 1
+    if n <= 0:
+        return set()
+    base = start_date.toordinal()
+    start_weekday = start_date.weekday()
     days = set()
-    cur = start_date
-    while cur <= end_date:
-        if (not exclude_weekends or cur.weekday() < 5) and cur not in holidays:
-            days.add(cur)
-        cur += datetime.timedelta(days=1)
+    for i in range(n):
+        if exclude_weekends and (start_weekday + i) % 7 >= 5:
+            continue
+        d = datetime.date.fromordinal(base + i)
+        if d not in holidays:
+            days.add(d)
     return days
 
 
@@ -179,77 +485,98 @@ def calculate_productivity_score(estimated_hours, logged_hours):
 
 
 def get_jira_details(date_str, jira=None, jira_username=None):
-    target_dt = dateparser.parse(date_str)
-    if not target_dt:
+    target_date = _parse_user_date(date_str)
+    if not target_date:
         print(f"Error: Could not parse date: {date_str}")
         return
-    target_date = target_dt.date()
     print(f"Fetching Jira details for {target_date}")
     if jira is None or jira_username is None:
         jira, jira_username = connect_to_jira()
         if not jira:
             return
     try:
-        me = get_me(jira)
-        jql_created = f"created >= '{target_date}' AND created < '{target_date + datetime.timedelta(days=1)}' AND reporter = '{jira_username}'"
+        next_day = target_date + _ONE_DAY
+        jql_created = JQL_CREATED_BY.format(start=target_date, end=next_day, reporter=jira_username)
+        jql_worklog = _worklog_jql(target_date, next_day)
+        # The identity lookup and the two searches are independent
+        # round-trips; overlap them instead of paying 3x RTT.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            me_future = executor.submit(get_me, jira)
+            # The created-issues listing only prints key + summary; don't
+            # pull the default type/status/estimate projection for it.
+            created_future = executor.submit(
+                _search_all_issues, jira, jql_created, fields="summary")
+            logged_future = executor.submit(
+                _search_all_issues, jira, jql_worklog, fields="summary,worklog", expand="worklog")
+            is_mine = _make_author_matcher(me_future.result())
+            created_issues = created_future.result()
+            logged_issues = logged_future.result()
         print(f"\n--- Issues Created by {jira_username} ---")
-        for issue in _search_all_issues(jira, jql_created):
-            print(f"- {issue.key}: {issue.fields.summary} ({issue.permalink()})")
-        formatted_date = target_date.strftime("%Y/%m/%d")
-        next_date = (target_date + datetime.timedelta(days=1)).strftime("%Y/%m/%d")
-        jql_worklog = f'worklogDate >= "{formatted_date}" AND worklogDate < "{next_date}" AND worklogAuthor = currentUser()'
+        for issue in created_issues:
+            print(f"- {issue.key}: {issue.fields.summary} ({_issue_url(issue.key)})")
         print(f"\n--- Work Logged ({jira_username}) ---")
-        total_hours = 0.0
-        for issue in _search_all_issues(jira, jql_worklog, expand="worklog"):
-            issue_total = 0.0
-            for wl in jira.worklogs(issue.key):
-                try:
-                    if _parse_iso_date(wl.started).date() == target_date and _is_my_worklog(wl, me):
-                        hrs = wl.timeSpentSeconds / 3600.0
-                        issue_total += hrs
-                        total_hours += hrs
-                except Exception:
-                    continue
-            if issue_total > 0:
-                print(f"{issue.key} - {issue_total:.2f}hrs ({issue.permalink()})")
+        worklogs_by_key = _collect_worklogs(jira, logged_issues)
+        target_iso = target_date.isoformat()
+        # Accumulate seconds in one pass, then emit the section in a single
+        # buffered write instead of printing from inside the loop.
+        seconds_by_issue = collections.defaultdict(float)
+        for issue in logged_issues:
+            for wl in worklogs_by_key.get(issue.key, []):
+                if _worklog_date_str(wl) == target_iso and is_mine(wl):
+                    seconds_by_issue[issue.key] += wl.timeSpentSeconds
+        sys.stdout.writelines(
+            f"{key} - {secs / 3600.0:.2f}hrs ({_issue_url(key)})\n"
+            for key, secs in seconds_by_issue.items()
+        )
+        total_hours = sum(seconds_by_issue.values()) / 3600.0
         print(f"\nTotal hours logged: {total_hours:.2f}")
     except Exception as e:  # pragma: no cover
         print(f"Error fetching details: {e}")
 
 
+# attrgetter caches the interned attribute names, beating getattr with a
+# string constant in the per-issue loop. The dotted form resolves the
+# common Option-object case (field.value) in one C-level call.
+_get_activity_field = operator.attrgetter(ACTIVITY_TYPE_FIELD)
+_get_activity_value = operator.attrgetter(f"{ACTIVITY_TYPE_FIELD}.value")
+
+
 def _extract_activity_type(issue):
-    field_value = getattr(issue.fields, ACTIVITY_TYPE_FIELD, None)
+    try:
+        return _get_activity_value(issue.fields)
+    except AttributeError:
+        pass
+    # Slow path: field absent, None, a raw string, or a dict payload.
+    try:
+        field_value = _get_activity_field(issue.fields)
+    except AttributeError:
+        return None
     if field_value is None:
         return None
-    if hasattr(field_value, "value"):
-        return field_value.value
     if isinstance(field_value, dict) and "value" in field_value:
         return field_value["value"]
     return str(field_value)
 
 
-def _collect_logged_hours(jira, issue, me=None):
-    total = 0.0
-    try:
-        worklogs = jira.worklogs(issue.key)
-    except Exception:
-        return 0.0
-    for wl in worklogs:
-        if me is None or _is_my_worklog(wl, me):
-            total += wl.timeSpentSeconds / 3600.0
-    return total
-
-
 def get_story_aggregate_productivity(issue, jira):
     included = []
     est_sum = 0.0
     logged_sum = 0.0
     missing_est = 0
-    for sub_ref in getattr(issue.fields, "subtasks", []) or []:
+    # One 'key in (...)' search pulls every subtask with worklogs embedded
+    # instead of a sequential jira.issue() round-trip per subtask.
+    sub_refs = getattr(issue.fields, "subtasks", []) or []
+    subtasks = []
+    if sub_refs:
         try:
-            sub = jira.issue(sub_ref.key, expand="worklog")
+            subtasks = _search_all_issues(
+                jira, f"key in ({','.join(ref.key for ref in sub_refs)})",
+                fields="summary,status,timeoriginalestimate,worklog",
+                expand="worklog")
         except Exception:
-            continue
+            subtasks = []
+    worklogs_by_key = _collect_worklogs(jira, subtasks)
+    for sub in subtasks:
         sub_status = sub.fields.status.name
         if not is_done_status(sub_status):
             continue
@@ -258,13 +585,14 @@ def get_story_aggregate_productivity(issue, jira):
             missing_est += 1
             continue
         est_hours = est_seconds / 3600.0
-        logged_hours = _collect_logged_hours(jira, sub)
+        logged_hours = sum(
+            wl.timeSpentSeconds for wl in worklogs_by_key.get(sub.key, [])) / 3600.0
         included.append({
             "key": sub.key,
             "summary": sub.fields.summary,
             "status": sub_status,
-            "estimated_hours": round(est_hours, 2),
-            "logged_hours": round(logged_hours, 2)
+            "estimated_hours": est_hours,
+            "logged_hours": logged_hours
         })
         est_sum += est_hours
         logged_sum += logged_hours
@@ -277,24 +605,30 @@ def get_story_aggregate_productivity(issue, jira):
         "included_subtasks": included,
         "included_subtasks_count": len(included),
         "excluded_subtasks_missing_estimate": missing_est,
-        "aggregated_estimated_hours": round(est_sum, 2),
-        "aggregated_logged_hours": round(logged_sum, 2),
+        "aggregated_estimated_hours": est_sum,
+        "aggregated_logged_hours": logged_sum,
         "aggregated_productivity_score": round(productivity, 2) if productivity is not None else None,
-        "link": issue.permalink()
+        "link": _issue_url(issue.key)
     }
 
 
-def get_issue_productivity(issue_key, jira, strict_task_status=False, aggregate_story=False):
+def _compute_productivity(issue, worklogs, jira=None, strict_task_status=False, aggregate_story=False):
+    """Productivity data for an already-fetched issue and its worklogs.
+
+    Pure computation: no HTTP calls except story aggregation, which needs
+    `jira` to pull subtasks. Callers holding expanded search results pass
+    them straight in instead of re-fetching the issue.
+    """
+    issue_key = issue.key
     try:
-        issue = jira.issue(issue_key, expand="worklog")
         issue_type_name = (issue.fields.issuetype.name or "").lower()
         status_name = issue.fields.status.name
         if "story" in issue_type_name:
             est_seconds = getattr(issue.fields, "timeoriginalestimate", None)
-            if aggregate_story or not est_seconds:
+            if (aggregate_story or not est_seconds) and jira is not None:
                 return get_story_aggregate_productivity(issue, jira)
         if ("task" in issue_type_name) and strict_task_status and not is_done_status(status_name):
-            return f"Issue {issue_key} status '{status_name}' not in DONE statuses ({', '.join(sorted(DONE_STATUSES))})"
+            return f"Issue {issue_key} status '{status_name}' not in DONE statuses ({_DONE_STATUSES_STR})"
         if "task" not in issue_type_name and "story" not in issue_type_name:
             return f"Issue {issue_key} is not a Task or Story (Type: {issue.fields.issuetype.name})"
         activity_type = _extract_activity_type(issue)
@@ -302,8 +636,8 @@ def get_issue_productivity(issue_key, jira, strict_task_status=False, aggregate_
         if not est_seconds:
             return f"Issue {issue_key} has no original time estimate"
         est_hours = est_seconds / 3600.0
-        total_logged_hours = _collect_logged_hours(jira, issue)
-        is_productive = activity_type in PRODUCTIVE_ACTIVITY_TYPES
+        total_logged_hours = sum(wl.timeSpentSeconds for wl in worklogs) / 3600.0
+        is_productive = activity_type in PRODUCTIVE_ACTIVITY_TYPES_SET
         productivity_score = None
         if is_productive:
             productivity_score = calculate_productivity_score(est_hours, total_logged_hours)
@@ -315,74 +649,107 @@ def get_issue_productivity(issue_key, jira, strict_task_status=False, aggregate_
             "type": issue.fields.issuetype.name,
             "status": status_name,
             "activity_type": activity_type,
-            "estimated_hours": round(est_hours, 2),
-            "logged_hours": round(total_logged_hours, 2),
+            "estimated_hours": est_hours,
+            "logged_hours": total_logged_hours,
             "productivity_score": productivity_score,
             "is_productive_activity": is_productive,
-            "link": issue.permalink(),
+            "link": _issue_url(issue_key),
             "story_aggregate": False
         }
     except Exception as e:  # pragma: no cover
-        return f"Error fetching issue {issue_key}: {e}"
+        return f"Error computing productivity for {issue_key}: {e}"
+
+
+# Productivity is a derived read-only metric, so repeat lookups for the same
+# issue within a short window can reuse the previous answer instead of
+# re-fetching. Cleared whenever a new connection is established.
+PRODUCTIVITY_CACHE_TTL = float(os.getenv("PRODUCTIVITY_CACHE_TTL", "60"))
+_productivity_cache = {}
+
+
+def get_issue_productivity(issue_or_key, jira, strict_task_status=False, aggregate_story=False):
+    """Compute productivity for an issue key or an already-fetched Issue.
+
+    Thin wrapper around `_compute_productivity`; accepting an Issue lets
+    callers that fetched one for other reasons (the choice-6 story prompt)
+    reuse it instead of paying a second round-trip.
+    """
+    issue = None if isinstance(issue_or_key, str) else issue_or_key
+    issue_key = issue_or_key if issue is None else issue.key
+    cache_key = (issue_key, strict_task_status, aggregate_story)
+    hit = _productivity_cache.get(cache_key)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < PRODUCTIVITY_CACHE_TTL:
+        return hit[1]
+    if issue is None:
+        try:
+            issue = jira.issue(issue_key, expand="worklog")
+        except Exception as e:  # pragma: no cover
+            return f"Error fetching issue {issue_key}: {e}"
+    result = _compute_productivity(issue, _issue_worklogs(jira, issue), jira,
+                                   strict_task_status=strict_task_status,
+                                   aggregate_story=aggregate_story)
+    _productivity_cache[cache_key] = (now, result)
+    return result
 
 
 def get_daily_productivity(date_str, jira, jira_username):
-    target_dt = dateparser.parse(date_str)
-    if not target_dt:
+    target_date = _parse_user_date(date_str)
+    if not target_date:
         print(f"Error: Could not parse date: {date_str}")
         return
-    target_date = target_dt.date()
     print(f"\n--- Daily Productivity Report for {target_date} (DONE issues only) ---")
     try:
-        me = get_me(jira)
-        formatted_date = target_date.strftime("%Y/%m/%d")
-        next_date = (target_date + datetime.timedelta(days=1)).strftime("%Y/%m/%d")
-        jql_worklog = f'worklogDate >= "{formatted_date}" AND worklogDate < "{next_date}" AND worklogAuthor = currentUser()'
-        logged_issues = _search_all_issues(jira, jql_worklog, expand="worklog")
+        is_mine = _make_author_matcher(get_me(jira))
+        jql_worklog = _worklog_jql(target_date, target_date + _ONE_DAY)
+        logged_issues = _search_all_issues(jira, jql_worklog, fields=PRODUCTIVITY_FIELDS, expand="worklog")
         if not logged_issues:
             print("No issues worked on this date.")
             return
+        worklogs_by_key = _collect_worklogs(jira, logged_issues)
         daily_productivity_scores = []
         issues_without_productivity = []
         productive_total_estimated = productive_total_logged = 0.0
+        target_iso = target_date.isoformat()
         for issue in logged_issues:
             date_logged_hours = 0.0
-            for wl in jira.worklogs(issue.key):
-                try:
-                    wl_date = _parse_iso_date(wl.started).date()
-                except Exception:
-                    continue
-                if wl_date == target_date and _is_my_worklog(wl, me):
+            for wl in worklogs_by_key.get(issue.key, []):
+                if _worklog_date_str(wl) == target_iso and is_mine(wl):
                     date_logged_hours += wl.timeSpentSeconds / 3600.0
             if date_logged_hours > 0:
                 status_name = issue.fields.status.name
                 if not is_done_status(status_name):
                     issues_without_productivity.append({
                         "issue_key": issue.key,
-                        "reason": f"Issue status '{status_name}' not in DONE statuses ({', '.join(sorted(DONE_STATUSES))})"
+                        "reason": f"Issue status '{status_name}' not in DONE statuses ({_DONE_STATUSES_STR})"
                     })
                     continue
-                pdata = get_issue_productivity(issue.key, jira)
+                pdata = _compute_productivity(issue, worklogs_by_key.get(issue.key, []), jira)
                 if isinstance(pdata, dict):
-                    pdata["date_logged_hours"] = round(date_logged_hours, 2)
+                    pdata["date_logged_hours"] = date_logged_hours
                     daily_productivity_scores.append(pdata)
                     if pdata.get("is_productive_activity"):
                         productive_total_estimated += pdata["estimated_hours"]
                         productive_total_logged += pdata["logged_hours"]
                 else:
                     issues_without_productivity.append({"issue_key": issue.key, "reason": pdata})
+        # Everything is fetched by this point; build each section in memory
+        # and emit it with one write instead of a print per line.
         if daily_productivity_scores:
-            print("\n=== DONE Issues (Details) ===")
+            lines = ["\n=== DONE Issues (Details) ==="]
             for item in daily_productivity_scores:
-                print(f"\n{item['issue_key']}: {item['summary']}")
-                print(f"  Type: {item['type']} | Status: {item['status']} | Activity Type: {item['activity_type']}")
-                print(f"  Estimated: {item['estimated_hours']}hrs | Logged (total): {item['logged_hours']}hrs | Logged today: {item['date_logged_hours']}hrs")
+                lines.append(f"\n{item['issue_key']}: {item['summary']}")
+                lines.append(f"  Type: {item['type']} | Status: {item['status']} | Activity Type: {item['activity_type']}")
+                lines.append(f"  Estimated: {item['estimated_hours']:.2f}hrs | Logged (total): {item['logged_hours']:.2f}hrs | Logged today: {item['date_logged_hours']:.2f}hrs")
                 if not item["is_productive_activity"]:
-                    print("  Activity type not in calculation list")
+                    lines.append("  Activity type not in calculation list")
+            print("\n".join(lines))
         if issues_without_productivity:
             print("\n=== Issues Excluded from Productivity (Not DONE or other) ===")
-            for item in issues_without_productivity:
-                print(f"{item['issue_key']}: {item['reason']}")
+            sys.stdout.writelines(
+                f"{item['issue_key']}: {item['reason']}\n"
+                for item in issues_without_productivity
+            )
         if productive_total_estimated > 0:
             score = calculate_productivity_score(productive_total_estimated, productive_total_logged)
             print(f"\nDaily Productivity (Selected Activity Types, DONE only): {score:.2f}%")
@@ -402,8 +769,6 @@ def get_daily_productivity(date_str, jira, jira_username):
         rows.append(["Final", "Selected Activity Types (DONE)", "", "", "", _format_percent(final_score)])
         print("\n=== Tabular Summary ===")
         _print_table(["Issue", "Activity Type", "Estimated (hrs)", "Logged (hrs)", "Productivity", "Final Productivity"], rows)
-        TARGET_MIN = 30.0
-        TARGET_MAX = 45.0
         print("\n=== Productivity Classification (After Summary) ===")
         for item in daily_productivity_scores:
             if not item["is_productive_activity"]:
@@ -411,25 +776,10 @@ def get_daily_productivity(date_str, jira, jira_username):
             ps = item["productivity_score"]
             if ps is None:
                 continue
-            msg_prefix = f"{item['issue_key']} -> {ps}% : "
-            if TARGET_MIN <= ps <= TARGET_MAX:
-                print(msg_prefix + "✅ Good productivity (within 30–45% target range). Great work.")
-            elif ps > TARGET_MAX:
-                print(msg_prefix + "ℹ️ Productivity above target range (>45%). Recheck if estimate was too high or if time is under‑logged.")
-            elif ps >= 0:
-                print(msg_prefix + "⚠️ Below target range (<30%). Add remaining work logs or validate the original estimate.")
-            else:
-                print(msg_prefix + "❌ Over estimate (logged more time than estimated). Review estimate or scope changes.")
+            print(f"{item['issue_key']} -> {ps}% : {_classify_score(ps)}")
         if final_score is not None:
             print("\nFinal Daily Aggregate Classification:")
-            if TARGET_MIN <= final_score <= TARGET_MAX:
-                print(f"{final_score:.2f}% ✅ Good productivity (within 30–45% target range). Great work.")
-            elif final_score > TARGET_MAX:
-                print(f"{final_score:.2f}% ℹ️ Above target range (>45%). Recheck estimates or under‑logging.")
-            elif final_score >= 0:
-                print(f"{final_score:.2f}% ⚠️ Below target range (<30%). Review estimates or missing work logs.")
-            else:
-                print(f"{final_score:.2f}% ❌ Over estimate (more time logged than estimated).")
+            print(f"{final_score:.2f}% {_classify_score(final_score, _CLASSIFY_FINAL)}")
     except Exception as e:  # pragma: no cover
         print(f"Error calculating daily productivity: {e}")
 
@@ -444,72 +794,64 @@ def get_range_productivity(start_date, end_date, jira, jira_username, period_lab
     if HOLIDAYS:
         print(f"Holidays excluded: {', '.join(sorted(d.isoformat() for d in HOLIDAYS))}")
     try:
-        me = get_me(jira)
-        start_fmt = start_date.strftime("%Y/%m/%d")
-        end_plus_1 = (end_date + datetime.timedelta(days=1)).strftime("%Y/%m/%d")
-        jql = f'worklogDate >= "{start_fmt}" AND worklogDate < "{end_plus_1}" AND worklogAuthor = currentUser()'
-        logged_issues = _search_all_issues(jira, jql, expand="worklog")
+        is_mine = _make_author_matcher(get_me(jira))
+        jql = _worklog_jql(start_date, end_date + _ONE_DAY)
+        logged_issues = _search_all_issues(jira, jql, fields=PRODUCTIVITY_FIELDS, expand="worklog")
         if not logged_issues:
             print("No issues worked in this period.")
             return
+        worklogs_by_key = _collect_worklogs(jira, logged_issues)
         range_productivity = []
         issues_without = []
         prod_est = prod_log = 0.0
+        included_iso = {d.isoformat() for d in included_dates}
         for issue in logged_issues:
             range_hours = 0.0
-            for wl in jira.worklogs(issue.key):
-                try:
-                    wl_date = _parse_iso_date(wl.started).date()
-                except Exception:
-                    continue
-                if wl_date in included_dates and _is_my_worklog(wl, me):
+            for wl in worklogs_by_key.get(issue.key, []):
+                if _worklog_date_str(wl) in included_iso and is_mine(wl):
                     range_hours += wl.timeSpentSeconds / 3600.0
             if range_hours > 0:
                 status_name = issue.fields.status.name
                 if not is_done_status(status_name):
                     issues_without.append({
                         "issue_key": issue.key,
-                        "reason": f"Issue status '{status_name}' not in DONE statuses ({', '.join(sorted(DONE_STATUSES))})"
+                        "reason": f"Issue status '{status_name}' not in DONE statuses ({_DONE_STATUSES_STR})"
                     })
                     continue
-                pdata = get_issue_productivity(issue.key, jira)
+                pdata = _compute_productivity(issue, worklogs_by_key.get(issue.key, []), jira)
                 if isinstance(pdata, dict):
-                    pdata["range_logged_hours"] = round(range_hours, 2)
+                    pdata["range_logged_hours"] = range_hours
                     range_productivity.append(pdata)
                     if pdata.get("is_productive_activity"):
                         prod_est += pdata["estimated_hours"]
                         prod_log += pdata["logged_hours"]
                 else:
                     issues_without.append({"issue_key": issue.key, "reason": pdata})
+        # Fetching is done; assemble each section in memory and write it in
+        # one shot rather than a print per line.
         if range_productivity:
-            print("\n=== DONE Issues with Productivity Scores ===")
-            TARGET_MIN = 30.0
-            TARGET_MAX = 45.0
+            lines = ["\n=== DONE Issues with Productivity Scores ==="]
             for item in range_productivity:
-                print(f"\n{item['issue_key']}: {item['summary']}")
-                print(f"  Type: {item['type']} | Status: {item['status']} | Activity: {item['activity_type']}")
-                print(f"  Estimated: {item['estimated_hours']}hrs | Total Logged: {item['logged_hours']}hrs | Logged in Period: {item['range_logged_hours']}hrs")
+                lines.append(f"\n{item['issue_key']}: {item['summary']}")
+                lines.append(f"  Type: {item['type']} | Status: {item['status']} | Activity: {item['activity_type']}")
+                lines.append(f"  Estimated: {item['estimated_hours']:.2f}hrs | Total Logged: {item['logged_hours']:.2f}hrs | Logged in Period: {item['range_logged_hours']:.2f}hrs")
                 if item["is_productive_activity"]:
-                    print(f"  Productivity Score: {item['productivity_score']}%")
+                    lines.append(f"  Productivity Score: {item['productivity_score']}%")
                     ps = item["productivity_score"]
                     if ps is not None:
-                        if TARGET_MIN <= ps <= TARGET_MAX:
-                            print("  ✅ Good productivity (within 30–45% target range). Great work.")
-                        elif ps > TARGET_MAX:
-                            print("  ℹ️ Productivity above target range (>45%). Recheck if estimate was too high or if time is under‑logged.")
-                        elif ps >= 0:
-                            print("  ⚠️ Below target range (<30%). Add remaining work logs or validate the original estimate.")
-                        else:
-                            print("  ❌ Over estimate (logged more time than estimated). Review estimate or scope changes.")
-                    print("  Activity type counted.")
+                        lines.append(f"  {_classify_score(ps)}")
+                    lines.append("  Activity type counted.")
                 else:
-                    print("  Activity type not counted for productivity list.")
-                    print(f"  Included types: {', '.join(PRODUCTIVE_ACTIVITY_TYPES)}")
-                    print(f"  Link: {item['link']}")
+                    lines.append("  Activity type not counted for productivity list.")
+                    lines.append(f"  Included types: {', '.join(PRODUCTIVE_ACTIVITY_TYPES)}")
+                    lines.append(f"  Link: {item['link']}")
+            print("\n".join(lines))
         if issues_without:
             print("\n=== Issues Excluded from Productivity (Not DONE or other) ===")
-            for item in issues_without:
-                print(f"{item['issue_key']}: {item['reason']}")
+            sys.stdout.writelines(
+                f"{item['issue_key']}: {item['reason']}\n"
+                for item in issues_without
+            )
         if prod_est > 0:
             score = calculate_productivity_score(prod_est, prod_log)
             print(f"\n{period_label} Productivity (Selected Activity Types, DONE only): {score:.2f}%")
@@ -524,17 +866,8 @@ def get_range_productivity(start_date, end_date, jira, jira_username, period_lab
         print("\n=== Tabular Summary ===")
         _print_table(["Issue", "Activity Type", "Estimated (hrs)", "Logged (hrs)", "Productivity", "Final Productivity"], rows)
         if final_score is not None:
-            TARGET_MIN = 30.0
-            TARGET_MAX = 45.0
             print("\nFinal Aggregate Classification:")
-            if TARGET_MIN <= final_score <= TARGET_MAX:
-                print(f"{final_score:.2f}% ✅ Good productivity (within 30–45% target range). Great work.")
-            elif final_score > TARGET_MAX:
-                print(f"{final_score:.2f}% ℹ️ Above target range (>45%). Recheck estimates or under‑logging.")
-            elif final_score >= 0:
-                print(f"{final_score:.2f}% ⚠️ Below target range (<30%). Review estimates or missing work logs.")
-            else:
-                print(f"{final_score:.2f}% ❌ Over estimate (more time logged than estimated).")
+            print(f"{final_score:.2f}% {_classify_score(final_score, _CLASSIFY_FINAL)}")
     except Exception as e:  # pragma: no cover
         print(f"Error calculating {period_label.lower()} productivity: {e}")
 
@@ -558,27 +891,25 @@ def get_monthly_productivity(jira, jira_username):
 
 
 def get_timesheet_completeness(jira, days_back=7, exclude_weekends=EXCLUDE_WEEKENDS_DEFAULT):
-    me = get_me(jira)
+    is_mine = _make_author_matcher(get_me(jira))
     today = datetime.date.today()
     start_date = today - datetime.timedelta(days=days_back - 1)
     included = _dates_in_range(start_date, today, exclude_weekends=exclude_weekends, holidays=HOLIDAYS)
-    fmt_start = start_date.strftime("%Y/%m/%d")
-    fmt_end_plus_1 = (today + datetime.timedelta(days=1)).strftime("%Y/%m/%d")
-    jql = f'worklogDate >= "{fmt_start}" AND worklogDate < "{fmt_end_plus_1}" AND worklogAuthor = currentUser()'
-    issues = _search_all_issues(jira, jql, expand="worklog")
-    logs_by_day = {d: 0.0 for d in included}
+    jql = _worklog_jql(start_date, today + _ONE_DAY)
+    issues = _search_all_issues(jira, jql, fields="worklog", expand="worklog")
+    worklogs_by_key = _collect_worklogs(jira, issues)
+    # One flat pass accumulating raw seconds; the division to hours happens
+    # once per day when the row is formatted, not once per worklog.
+    seconds_by_day = {d.isoformat(): 0.0 for d in included}
     for issue in issues:
-        for wl in jira.worklogs(issue.key):
-            try:
-                wl_date = _parse_iso_date(wl.started).date()
-            except Exception:
-                continue
-            if wl_date in included and _is_my_worklog(wl, me):
-                logs_by_day[wl_date] += wl.timeSpentSeconds / 3600.0
+        for wl in worklogs_by_key.get(issue.key, []):
+            day = _worklog_date_str(wl)
+            if day in seconds_by_day and is_mine(wl):
+                seconds_by_day[day] += wl.timeSpentSeconds
     rows = []
     total_gap = 0.0
     for d in sorted(included):
-        hrs = round(logs_by_day.get(d, 0.0), 2)
+        hrs = round(seconds_by_day.get(d.isoformat(), 0.0) / 3600.0, 2)
         gap = max(0.0, WORKING_HOURS_PER_DAY - hrs)
         total_gap += gap
         rows.append([d.isoformat(), f"{hrs:.2f}", f"{WORKING_HOURS_PER_DAY:.2f}", f"{gap:.2f}"])
@@ -588,6 +919,43 @@ def get_timesheet_completeness(jira, days_back=7, exclude_weekends=EXCLUDE_WEEKE
     print(f"Total gap: {total_gap:.2f} hrs")
 
 
+def _print_productivity_result(result):
+    """Print a single-issue (or story-aggregate) productivity result."""
+    if not isinstance(result, dict):
+        print(result)
+        return
+    if result.get("story_aggregate"):
+        print(f"\nStory: {result['issue_key']} - {result['summary']} (Status: {result['story_status']})")
+        print(f"Included Done subtasks: {result['included_subtasks_count']} | Missing est excluded: {result['excluded_subtasks_missing_estimate']}")
+        print(f"Aggregated Estimated Hours: {result['aggregated_estimated_hours']:.2f}")
+        print(f"Aggregated Logged Hours: {result['aggregated_logged_hours']:.2f}")
+        agg_score = result['aggregated_productivity_score']
+        if agg_score is not None:
+            print(f"Aggregated Productivity Score: {agg_score}%")
+        else:
+            print("Aggregated Productivity Score: N/A (no estimates)")
+        print("Subtasks:")
+        for st in result['included_subtasks']:
+            print(f"  - {st['key']} [{st['status']}] Est {st['estimated_hours']:.2f}h Logged {st['logged_hours']:.2f}h")
+        print(f"Link: {result['link']}")
+    else:
+        print(f"\nIssue: {result['issue_key']} - {result['summary']}")
+        print(f"Type: {result['type']} | Status: {result['status']}")
+        print(f"Activity Type: {result['activity_type']}")
+        print(f"Estimated Hours: {result['estimated_hours']:.2f}")
+        print(f"Total Logged Hours: {result['logged_hours']:.2f}")
+    if result['is_productive_activity']:
+        print(f"Productivity Score: {result['productivity_score']}%")
+        ps = result['productivity_score']
+        if ps is not None:
+            print(_classify_score(ps))
+        print("Activity type counted.")
+    else:
+        print("Activity type not counted for productivity list.")
+        print(f"Included types: {', '.join(PRODUCTIVE_ACTIVITY_TYPES)}")
+        print(f"Link: {result['link']}")
+
+
 def main():  # console script entry
     print("=== Jira Productivity & Work Hours Tracker ===")
     print("Checking for stored credentials...")
@@ -638,67 +1006,59 @@ def main():  # console script entry
         elif choice == "5":
             get_monthly_productivity(jira, jira_username)
         elif choice == "6":
-            issue_key = input("Enter the Jira issue key (e.g., 'PROJ-123'): ").strip().upper()
+            raw_keys = input("Enter Jira issue key(s), comma-separated (e.g., 'PROJ-123' or 'PROJ-1, PROJ-2'): ").strip().upper()
+            keys = [k for k in re.split(r"[\s,]+", raw_keys) if k]
             strict = input("Strict task status (Done only)? (y/N): ").strip().lower() in {"y", "yes"}
-            aggregate_story = False
-            try:
-                tmp_issue = jira.issue(issue_key)
-                if (tmp_issue.fields.issuetype.name or "").lower().find("story") >= 0:
-                    has_est = bool(getattr(tmp_issue.fields, "timeoriginalestimate", None))
-                    default_yes = "Y" if not has_est else "N"
-                    aggregate_story = input(f"Aggregate story subtasks? (y/N) [default {default_yes}]: ").strip().lower()
-                    if aggregate_story == "":
-                        aggregate_story = (default_yes == "Y")
-                    else:
-                        aggregate_story = aggregate_story in {"y", "yes"}
-                else:
-                    aggregate_story = False
-            except Exception:
-                pass
-            print(f"\n--- Productivity Report for {issue_key} ---")
-            result = get_issue_productivity(issue_key, jira, strict_task_status=strict, aggregate_story=aggregate_story)
-            if isinstance(result, dict):
-                if result.get("story_aggregate"):
-                    print(f"\nStory: {result['issue_key']} - {result['summary']} (Status: {result['story_status']})")
-                    print(f"Included Done subtasks: {result['included_subtasks_count']} | Missing est excluded: {result['excluded_subtasks_missing_estimate']}")
-                    print(f"Aggregated Estimated Hours: {result['aggregated_estimated_hours']}")
-                    print(f"Aggregated Logged Hours: {result['aggregated_logged_hours']}")
-                    agg_score = result['aggregated_productivity_score']
-                    if agg_score is not None:
-                        print(f"Aggregated Productivity Score: {agg_score}%")
-                    else:
-                        print("Aggregated Productivity Score: N/A (no estimates)")
-                    print("Subtasks:")
-                    for st in result['included_subtasks']:
-                        print(f"  - {st['key']} [{st['status']}] Est {st['estimated_hours']}h Logged {st['logged_hours']}h")
-                    print(f"Link: {result['link']}")
-                else:
-                    print(f"\nIssue: {result['issue_key']} - {result['summary']}")
-                    print(f"Type: {result['type']} | Status: {result['status']}")
-                    print(f"Activity Type: {result['activity_type']}")
-                    print(f"Estimated Hours: {result['estimated_hours']}")
-                    print(f"Total Logged Hours: {result['logged_hours']}")
-                if result['is_productive_activity']:
-                    print(f"Productivity Score: {result['productivity_score']}%")
-                    ps = result['productivity_score']
-                    if ps is not None:
-                        TARGET_MIN = 30.0
-                        TARGET_MAX = 45.0
-                        if TARGET_MIN <= ps <= TARGET_MAX:
-                            print("✅ Good productivity (within 30–45% target range). Great work.")
-                        elif ps > TARGET_MAX:
-                            print("ℹ️ Productivity above target range (>45%). Recheck if estimate was too high or if time is under‑logged.")
-                        elif ps >= 0:
-                            print("⚠️ Below target range (<30%). Add remaining work logs or validate the original estimate.")
-                        else:
-                            print("❌ Over estimate (logged more time than estimated). Review estimate or scope changes.")
-                    print("Activity type counted.")
-                else:
-                    print("Activity type not counted for productivity list.")
-                    print(f"Included types: {', '.join(PRODUCTIVE_ACTIVITY_TYPES)}")
-                    print(f"Link: {result['link']}")
+            if len(keys) > 1:
+                # Sprint-review shape: one JQL search fetches every issue with
+                # worklogs embedded instead of N individual round-trips.
+                try:
+                    issues = jira.search_issues(
+                        f"key in ({','.join(keys)})",
+                        fields=PRODUCTIVITY_FIELDS,
+                        expand="worklog",
+                        maxResults=len(keys),
+                    )
+                except Exception as e:
+                    print(f"Error fetching issues: {e}")
+                    issues = []
+                worklogs_by_key = _collect_worklogs(jira, issues)
+                found = {issue.key for issue in issues}
+                for key in keys:
+                    if key not in found:
+                        print(f"\n--- {key}: not found or not visible ---")
+                for issue in issues:
+                    print(f"\n--- Productivity Report for {issue.key} ---")
+                    result = _compute_productivity(
+                        issue, worklogs_by_key.get(issue.key, []), jira,
+                        strict_task_status=strict,
+                    )
+                    _print_productivity_result(result)
             else:
-                print(result)
+                issue_key = keys[0] if keys else raw_keys
+                aggregate_story = False
+                tmp_issue = None
+                try:
+                    # One fetch serves both the story prompt and the report;
+                    # previously the issue was retrieved again inside
+                    # get_issue_productivity.
+                    tmp_issue = jira.issue(issue_key, fields=PRODUCTIVITY_FIELDS, expand="worklog")
+                    if (tmp_issue.fields.issuetype.name or "").lower().find("story") >= 0:
+                        has_est = bool(getattr(tmp_issue.fields, "timeoriginalestimate", None))
+                        default_yes = "Y" if not has_est else "N"
+                        aggregate_story = input(f"Aggregate story subtasks? (y/N) [default {default_yes}]: ").strip().lower()
+                        if aggregate_story == "":
+                            aggregate_story = (default_yes == "Y")
+                        else:
+                            aggregate_story = aggregate_story in {"y", "yes"}
+                    else:
+                        aggregate_story = False
+                except Exception:
+                    pass
+                print(f"\n--- Productivity Report for {issue_key} ---")
+                result = get_issue_productivity(tmp_issue if tmp_issue is not None else issue_key,
+                                                jira, strict_task_status=strict, aggregate_story=aggregate_story)
+                _print_productivity_result(result)
         elif choice == "7":
             try:
                 days = int(input("Days back (default 7): ").strip() or "7")
@@ -10,6 +10,7 @@ This keeps secret handling centralized.
 
 from __future__ import annotations
 
+import json
 import os
 
 try:
@@ -27,15 +28,72 @@ def prompt_visible(prompt: str) -> str:
 
 SERVICE = "jira-work-hours"
 DEFAULT_JIRA_URL = "https://amatjira.amat.com"  # fixed common URL per user request
+CREDENTIALS_KEY = "credentials"  # single JSON blob: {"user", "pat", "url"}
+
+# Legacy layout (one keyring entry per field) written by older versions.
+_LEGACY_KEYS = ("JIRA_USERNAME", "JIRA_PAT", "JIRA_URL")
+
+
+def _load_stored_credentials():
+    """Read (username, pat) from keyring in a single lookup.
+
+    Each keyring read is an IPC round-trip to the OS secret service
+    (Security framework on macOS, DBus Secret Service on Linux), so one
+    JSON blob beats three per-field entries. Falls back to the legacy
+    per-field layout and migrates it to the blob on first read.
+    """
+    if not keyring:
+        return None, None
+    try:
+        raw = keyring.get_password(SERVICE, CREDENTIALS_KEY)
+    except Exception as e:  # pragma: no cover - backend specific
+        print(f"Could not access keyring: {e}")
+        return None, None
+    if raw:
+        try:
+            data = json.loads(raw)
+            return data.get("user"), data.get("pat")
+        except ValueError:
+            pass  # corrupt blob; treat as absent
+    try:
+        user = keyring.get_password(SERVICE, "JIRA_USERNAME")
+        pat = keyring.get_password(SERVICE, "JIRA_PAT")
+    except Exception:  # pragma: no cover - backend specific
+        return None, None
+    if user and pat:
+        # Silent: the user is just reading stored credentials, not saving.
+        _save_stored_credentials(user, pat, quiet=True)
+    return user, pat
+
+
+def _save_stored_credentials(user: str, pat: str, quiet: bool = False) -> None:
+    """Persist credentials as one keyring entry (best-effort).
+
+    `quiet` suppresses the confirmation for internal writes such as the
+    legacy-layout migration.
+    """
+    if not keyring:
+        return
+    try:
+        keyring.set_password(
+            SERVICE, CREDENTIALS_KEY,
+            json.dumps({"user": user, "pat": pat, "url": DEFAULT_JIRA_URL}),
+        )
+        if not quiet:
+            print("Credentials saved to keyring.")
+    except Exception as e:  # pragma: no cover - backend specific
+        print(f"Could not save credentials to keyring: {e}")
 
 
 def clear_stored_credentials() -> None:
     """Clear stored credentials from keyring. Useful for testing or switching accounts."""
     if keyring:  # pragma: no branch - simple gate
         try:
-            keyring.delete_password(SERVICE, "JIRA_USERNAME")
-            keyring.delete_password(SERVICE, "JIRA_PAT")
-            keyring.delete_password(SERVICE, "JIRA_URL")
+            for key in (CREDENTIALS_KEY,) + _LEGACY_KEYS:
+                try:
+                    keyring.delete_password(SERVICE, key)
+                except Exception:
+                    pass  # entry may not exist in this layout
             print("Stored credentials cleared from keyring.")
         except Exception as e:  # pragma: no cover - keyring backend specifics
             print(f"Could not clear credentials: {e}")
@@ -54,58 +112,34 @@ def ensure_credentials(force_login: bool = False):
     pat = os.environ.get("JIRA_PAT")
 
     # Try to load from keyring first (unless force_login)
-    if not force_login and keyring:
-        try:
-            kr_user = keyring.get_password(SERVICE, "JIRA_USERNAME")
-            kr_pat = keyring.get_password(SERVICE, "JIRA_PAT")
-
-            if kr_user and kr_pat:
-                # Found stored credentials, use them
-                print("Using stored credentials from keyring.")
-                os.environ["JIRA_USERNAME"] = kr_user
-                os.environ["JIRA_PAT"] = kr_pat
-                os.environ["JIRA_URL"] = DEFAULT_JIRA_URL
-                return DEFAULT_JIRA_URL, kr_user, kr_pat
-        except Exception as e:  # pragma: no cover - backend specific
-            # Keyring access failed, continue to prompt
-            print(f"Could not access keyring: {e}")
+    if not force_login:
+        kr_user, kr_pat = _load_stored_credentials()
+        if kr_user and kr_pat:
+            # Found stored credentials, use them
+            print("Using stored credentials from keyring.")
+            os.environ["JIRA_USERNAME"] = kr_user
+            os.environ["JIRA_PAT"] = kr_pat
+            os.environ["JIRA_URL"] = DEFAULT_JIRA_URL
+            return DEFAULT_JIRA_URL, kr_user, kr_pat
 
     # If force_login or credentials not in keyring, prompt user
     if force_login or not (user and pat):
         print("Please enter your Jira credentials:")
 
-        # Prompt for username
         u = prompt_visible("your-id: ")
         if u:
             user = u
             os.environ["JIRA_USERNAME"] = u
-            # Save to keyring
-            try:
-                if keyring:
-                    keyring.set_password(SERVICE, "JIRA_USERNAME", u)
-                    print("Username saved to keyring.")
-            except Exception as e:  # pragma: no cover
-                print(f"Could not save username to keyring: {e}")
-
-        # Prompt for PAT
+
         p = prompt_visible("jira-pat-token: ")
         if p:
             pat = p
             os.environ["JIRA_PAT"] = p
-            # Save to keyring
-            try:
-                if keyring:
-                    keyring.set_password(SERVICE, "JIRA_PAT", p)
-                    print("PAT token saved to keyring.")
-            except Exception as e:  # pragma: no cover
-                print(f"Could not save PAT to keyring: {e}")
-
-    # Always set the URL
+
+        if user and pat:
+            _save_stored_credentials(user, pat)
+
+    # Always set the URL (stored as part of the credentials blob)
     os.environ["JIRA_URL"] = DEFAULT_JIRA_URL
-    try:
-        if keyring:
-            keyring.set_password(SERVICE, "JIRA_URL", DEFAULT_JIRA_URL)
-    except Exception:  # pragma: no cover
-        pass
 
     return DEFAULT_JIRA_URL, user, pat